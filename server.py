@@ -1,13 +1,20 @@
 """
 mcp server for rss news parsing with content scraping
-https://pypi.org/project/rss-parser/
+https://lxml.de/
 """
 
+import asyncio
+import heapq
+from datetime import date, datetime
 from fastmcp import FastMCP
-from typing import List, Dict, Any
-from utils.text_sanitizer import is_today_news, create_news_summary
+from lxml import etree
+from requests import RequestException
+from typing import List, Dict, Any, Iterator, Tuple
+from utils.text_sanitizer import create_news_summary, scrape_article_contents
 from utils.rss_helpers import (
-    extract_field_content,
+    MIN_DATE,
+    FeedItem,
+    canonicalize_link,
     get_article_link,
     parse_date_safely,
     fetch_rss_feed
@@ -16,9 +23,88 @@ from utils.rss_helpers import (
 # create mcp server
 mcp = FastMCP("rss-feeds-parser-server")
 
+# feed download and parsing failures reported back to the client as an error item
+_FEED_ERRORS = (RequestException, etree.XMLSyntaxError, ValueError)
+
+
+def _iter_candidates(items: List[FeedItem], today_only: bool) -> Iterator[Tuple[datetime, str, str, str, str]]:
+    """
+    yield (published, title, description, link, pub_date) for feed items that pass the filters
+    applies the optional today filter and keeps only the latest copy of a repeated article
+    """
+    # candidates by canonical link, items without a link are keyed by position and always kept
+    candidates = {}
+    today = date.today()
+    
+    for index, item in enumerate(items):
+        # parse the date once, it drives both the date filter and the ordering
+        published = parse_date_safely(item.pub_date)
+        
+        # apply date filter if requested (items without a usable date are kept)
+        if today_only and published != MIN_DATE and published.date() != today:
+            continue
+        
+        # a story republished with a newer date replaces its older copy, so each article is
+        # scraped only once and under its latest date
+        link = get_article_link(item)
+        key = canonicalize_link(link) or index
+        previous = candidates.get(key)
+        if previous is None or published > previous[0]:
+            candidates[key] = (published, item.title, item.description, link, item.pub_date)
+    
+    yield from candidates.values()
+
+
+def _get_latest_news(
+    rss_url: str,
+    limit: int,
+    title_limit: int,
+    desc_limit: int,
+    content_limit: int,
+    scrape_content: bool,
+    summarize_content: bool,
+    summary_method: str,
+    today_only: bool
+) -> List[Dict[str, Any]]:
+    """
+    fetch a feed and build summaries for its latest articles
+    
+    returns:
+        list of news summaries, ordered by latest first
+    """
+    # fetch and parse rss feed
+    items = fetch_rss_feed(rss_url)
+    
+    # keep the latest articles without sorting the whole feed, candidates stream straight into the heap
+    latest = heapq.nlargest(limit, _iter_candidates(items, today_only), key=lambda candidate: candidate[0])
+    
+    # scrape all selected articles concurrently instead of one after another
+    if scrape_content:
+        scraped = scrape_article_contents([link for _, _, _, link, _ in latest])
+    else:
+        scraped = [None] * len(latest)
+    
+    # create news summaries with optional summarization of the scraped content
+    return [
+        create_news_summary(
+            title=title,
+            description=description,
+            link=link,
+            pub_date=pub_date,
+            title_limit=title_limit,
+            desc_limit=desc_limit,
+            scrape_content=scrape_content,
+            content_limit=content_limit,
+            summarize_content=summarize_content,
+            summary_method=summary_method,
+            scraped_content=scraped_content
+        )
+        for (_, title, description, link, pub_date), scraped_content in zip(latest, scraped)
+    ]
+
 
 @mcp.tool
-def get_all_news_summary(
+async def get_all_news_summary(
     rss_url: str = "https://www.corriere.it/feed-hp/homepage.xml",
     limit: int = 10,
     title_limit: int = 100,
@@ -47,63 +133,26 @@ def get_all_news_summary(
         list of news articles with title, description, and scraped content (optionally summarized), ordered by latest first
     """
     try:
-        # fetch and parse rss feed
-        rss = fetch_rss_feed(rss_url)
-        
-        articles = []
-        
-        for item in rss.channel.items:
-            # extract article fields
-            title = extract_field_content(getattr(item, 'title', ''))
-            description = extract_field_content(getattr(item, 'description', ''))
-            pub_date = extract_field_content(getattr(item, 'pub_date', ''))
-            link = get_article_link(item)
-            
-            # apply date filter if requested
-            if today_only and pub_date and not is_today_news(pub_date):
-                continue
-            
-            # create news summary with optional content scraping and summarization
-            news_summary = create_news_summary(
-                title=title,
-                description=description,
-                link=link,
-                pub_date=pub_date,
-                title_limit=title_limit,
-                desc_limit=desc_limit,
-                scrape_content=scrape_content,
-                content_limit=content_limit,
-                summarize_content=summarize_content,
-                summary_method=summary_method
-            )
-            
-            # store pub_date temporarily for sorting
-            news_summary['_sort_date'] = pub_date
-            
-            articles.append(news_summary)
-            
-            # stop when we have enough articles
-            if len(articles) >= limit:
-                break
-        
-        # sort by publication date (latest first)
-        articles.sort(
-            key=lambda article: parse_date_safely(article.get('_sort_date', '')),
-            reverse=True
+        # run the blocking fetch/scrape pipeline in a worker thread to keep the event loop free
+        return await asyncio.to_thread(
+            _get_latest_news,
+            rss_url=rss_url,
+            limit=limit,
+            title_limit=title_limit,
+            desc_limit=desc_limit,
+            content_limit=content_limit,
+            scrape_content=scrape_content,
+            summarize_content=summarize_content,
+            summary_method=summary_method,
+            today_only=today_only
         )
         
-        # remove temporary sort field
-        for article in articles:
-            article.pop('_sort_date', None)
-        
-        return articles
-        
-    except Exception as e:
+    except _FEED_ERRORS as e:
         return [{"error": f"failed to fetch news: {str(e)}"}]
 
 
 @mcp.tool
-def get_serie_a_news(
+async def get_serie_a_news(
     limit: int = 10,
     title_limit: int = 100,
     desc_limit: int = 500,
@@ -133,56 +182,19 @@ def get_serie_a_news(
     rss_url = "https://www.gazzetta.it/dynamic-feed/rss/section/Calcio/Serie-A.xml"
     
     try:
-        # fetch and parse rss feed
-        rss = fetch_rss_feed(rss_url)
-        
-        articles = []
-        
-        for item in rss.channel.items:
-            # extract article fields
-            title = extract_field_content(getattr(item, 'title', ''))
-            description = extract_field_content(getattr(item, 'description', ''))
-            pub_date = extract_field_content(getattr(item, 'pub_date', ''))
-            link = get_article_link(item)
-            
-            # apply date filter if requested
-            if today_only and pub_date and not is_today_news(pub_date):
-                continue
-            
-            # create news summary with optional content scraping and summarization
-            news_summary = create_news_summary(
-                title=title,
-                description=description,
-                link=link,
-                pub_date=pub_date,
-                title_limit=title_limit,
-                desc_limit=desc_limit,
-                scrape_content=scrape_content,
-                content_limit=content_limit,
-                summarize_content=summarize_content,
-                summary_method=summary_method
-            )
-            
-            # store pub_date temporarily for sorting
-            news_summary['_sort_date'] = pub_date
-            
-            articles.append(news_summary)
-            
-            # stop when we have enough articles
-            if len(articles) >= limit:
-                break
-        
-        # sort by publication date (latest first)
-        articles.sort(
-            key=lambda article: parse_date_safely(article.get('_sort_date', '')),
-            reverse=True
+        # run the blocking fetch/scrape pipeline in a worker thread to keep the event loop free
+        return await asyncio.to_thread(
+            _get_latest_news,
+            rss_url=rss_url,
+            limit=limit,
+            title_limit=title_limit,
+            desc_limit=desc_limit,
+            content_limit=content_limit,
+            scrape_content=scrape_content,
+            summarize_content=summarize_content,
+            summary_method=summary_method,
+            today_only=today_only
         )
         
-        # remove temporary sort field
-        for article in articles:
-            article.pop('_sort_date', None)
-        
-        return articles
-        
-    except Exception as e:
+    except _FEED_ERRORS as e:
         return [{"error": f"failed to fetch serie a news: {str(e)}"}]
\ No newline at end of file
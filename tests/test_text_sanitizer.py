@@ -0,0 +1,78 @@
+"""
+tests for text sanitization utilities
+"""
+
+import random
+import unittest
+
+from utils.text_sanitizer import (
+    _beautify_description,
+    _sanitize_title,
+    beautify_description,
+    clean_html_tags,
+    sanitize_title,
+)
+
+# building blocks for generated titles and descriptions, including stray '<' and '>',
+# entities with and without ';' and tags whose attributes contain '>'
+_PIECES = [
+    'parola', 'DAL NOSTRO INVIATO', 'x' * 40, '-', '...', '1 <2> 3', 'a<b', '<', '>', '&',
+    '<p>', '<b>', '</b>', '<a href="x>y">', '<!-- c -->', '&amp;', '&amp', '&egrave;', '&#39;',
+    '\n', '\t', '  ', '\xa0',
+]
+
+
+class CleanHtmlTagsTest(unittest.TestCase):
+    """clean_html_tags output on markup found in feeds"""
+
+    def test_removes_tags_and_decodes_entities(self):
+        self.assertEqual(clean_html_tags('<p>Hello <b>world</b> &amp; more</p>'), 'Hello world & more')
+
+    def test_keeps_text_after_stray_angle_bracket(self):
+        self.assertEqual(clean_html_tags('if a<b then'), 'if a<b then')
+
+    def test_keeps_every_document(self):
+        html = '<html><body><p>uno</p></body></html><html><body><p>due</p></body></html>'
+        self.assertEqual(clean_html_tags(html), 'unodue')
+
+    def test_whole_documents_without_text(self):
+        for html in ('<html>', '<html><!-- vuoto --></html>'):
+            self.assertEqual(clean_html_tags(html), '')
+        self.assertEqual(clean_html_tags('<html><head><title>Titolo</title></head></html>'), 'Titolo')
+
+
+class PrefixCleaningTest(unittest.TestCase):
+    """cleaning only a prefix must give the same leading characters as cleaning everything"""
+
+    def assertPrefixEqual(self, text: str, max_length: int):
+        self.assertEqual(
+            beautify_description(text, max_length)[:max_length],
+            _beautify_description(text)[:max_length],
+            repr(text)
+        )
+        self.assertEqual(
+            sanitize_title(text, max_length)[:max_length],
+            _sanitize_title(text)[:max_length],
+            repr(text)
+        )
+
+    def test_stray_angle_bracket_past_the_prefix(self):
+        self.assertPrefixEqual('1 <2> 3 ' + 'parola ' * 200 + ' if a<b then end', 100)
+
+    def test_tag_left_open_in_the_prefix(self):
+        # the 'a<b' is closed by the '>' inside the href, just past the first window
+        text = 'parola a<b ' + 'parola ' * 7 + 'x' * 54 + '<a href="x>y">fine ' + 'parola ' * 30
+        self.assertPrefixEqual(text, 50)
+
+    def test_generated_markup(self):
+        rng = random.Random(1)
+        for _ in range(3000):
+            text = ''.join(
+                rng.choice(_PIECES) + rng.choice(('', ' ')) for _ in range(rng.randint(1, 150))
+            )
+            for max_length in (20, 50, 100, 300):
+                self.assertPrefixEqual(text, max_length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+shared http session for rss fetching and article scraping
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# encodings urllib3 can decode in this install (br only once brotli is installed),
+# sent instead of a literal so servers never pick an encoding we cannot read
+from urllib3.util.request import ACCEPT_ENCODING
+
+__all__ = ['session', 'ACCEPT_ENCODING']
+
+# longest Retry-After wait honoured before retrying, tools should not stall for minutes
+_MAX_RETRY_AFTER_SECONDS = 5
+
+
+class _BoundedRetry(Retry):
+    """urllib3 retry policy that caps the wait requested by a Retry-After header"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER_SECONDS)
+
+
+# single session reused across tool calls so connections to the same host are kept alive
+session = requests.Session()
+
+# pool enough connections per host for concurrent requests and retry transient failures:
+# connection errors and timeouts, rate limiting (honouring a short Retry-After) and
+# gateway errors from overloaded news sites. other 4xx responses are permanent and not retried
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=_BoundedRetry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+)
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
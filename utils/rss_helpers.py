@@ -2,25 +2,82 @@
 helper functions for rss feed parsing and processing
 """
 
-from rss_parser import RSSParser
-from requests import get
-from datetime import datetime
+import threading
+import time
+from io import BytesIO
+from types import MappingProxyType
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import BinaryIO, List, NamedTuple, Union
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from lxml import etree
+import requests
+from urllib3.exceptions import DecodeError, HTTPError as Urllib3HTTPError
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dateutil import parser as date_parser
+from utils.http_session import session, ACCEPT_ENCODING
+from utils.ttl_cache import ttl_cache
+
+class FeedItem(NamedTuple):
+    """fields of a single rss item used by the news tools"""
+    title: str
+    description: str
+    link: str
+    pub_date: str
+    guid: str
+
+
+# returned by parse_date_safely for missing or unparseable dates
+MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+# headers that mimic a real browser (some sites require this), built once and read-only
+_FEED_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/rss+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.1',
+    'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Cache-Control': 'max-age=0'
+})
+
+# largest feed body accepted, real feeds are at most a few hundred kilobytes
+MAX_FEED_BYTES = 10 * 1024 * 1024
+
+# etag, last-modified and parsed feed from the last full download of recently fetched feeds
+_MAX_CACHED_FEEDS = 64
+_feed_validators = {}
+_feed_validators_lock = threading.Lock()
+
+# downloads currently running per feed url, shared by concurrent callers
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# consecutive download failures and when a failing feed may be tried again, kept for
+# the most recently failing feeds only
+_FEED_FAILURE_THRESHOLD = 2
+_FEED_COOLDOWN_SECONDS = 60
+_feed_failures = {}
+_feed_cold_until = {}
+_feed_health_lock = threading.Lock()
 
 def extract_field_content(field) -> str:
     """
     extract content from rss field that may be a string or object
-    handles rss-parser's object format with content and attributes
+    handles objects that expose their text through a content attribute
     """
-    if field is None:
-        return ''
+    # parsed feed fields are already plain strings
+    if type(field) is str:
+        return field
     
-    # check for content attribute (rss-parser object format)
-    if hasattr(field, 'content'):
+    # read the content attribute directly (object format), cheaper than hasattr + getattr
+    try:
         return str(field.content)
+    except AttributeError:
+        pass
     
     # fallback to string conversion
-    return str(field)
+    return '' if field is None else str(field)
 
 
 def get_article_link(item) -> str:
@@ -38,38 +95,218 @@ def get_article_link(item) -> str:
     return extract_field_content(getattr(item, 'link', ''))
 
 
+def canonicalize_link(link: str) -> str:
+    """
+    normalize an article url so republished copies of the same story compare equal
+    drops the fragment and utm_* tracking parameters, keeps any other query parameters
+    """
+    if not link:
+        return link
+    
+    parts = urlsplit(link)
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_')
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+@lru_cache(maxsize=4096)
 def parse_date_safely(date_str: str) -> datetime:
-    """parse date string, returning datetime.min if parsing fails"""
+    """
+    parse date string, returning datetime.min if parsing fails
+    results are always timezone-aware (naive dates are assumed utc) so they compare safely
+    """
+    if not date_str:
+        return MIN_DATE
+    
+    # rss pubDate is almost always rfc 822, which the stdlib parses much faster than dateutil
     try:
-        if date_str:
-            return date_parser.parse(date_str)
-    except:
-        pass
-    return datetime.min
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        try:
+            parsed = date_parser.parse(date_str)
+        except:
+            return MIN_DATE
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class _LimitedReader:
+    """file-like wrapper that fails once more than max_bytes have been read"""
+    
+    def __init__(self, stream: BinaryIO, max_bytes: int):
+        self._stream = stream
+        self._remaining = max_bytes
+        self._max_bytes = max_bytes
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise ValueError(f"feed is larger than {self._max_bytes} bytes")
+        return data
 
 
-def fetch_rss_feed(url: str, timeout: int = 15) -> RSSParser:
+def parse_rss_items(xml_source: Union[bytes, BinaryIO]) -> List[FeedItem]:
+    """
+    parse the items of an rss feed
+    streams the document so each item element is freed as soon as its fields are read
+    
+    args:
+        xml_source: raw feed body or a binary stream of it (bytes, so the xml declaration picks the encoding)
+        
+    returns:
+        list of feed items in feed order
+    """
+    if isinstance(xml_source, bytes):
+        xml_source = BytesIO(xml_source)
+    
+    # never resolve external entities or hit the network from feed content,
+    # and recover from the malformed markup (stray '&', bad entities) common in real feeds
+    context = etree.iterparse(
+        xml_source, events=('end',), tag='item',
+        resolve_entities=False, no_network=True, recover=True
+    )
+    
+    items = []
+    for _, element in context:
+        items.append(FeedItem(
+            title=(element.findtext('title') or '').strip(),
+            description=(element.findtext('description') or '').strip(),
+            link=(element.findtext('link') or '').strip(),
+            pub_date=(element.findtext('pubDate') or '').strip(),
+            guid=(element.findtext('guid') or '').strip()
+        ))
+        
+        # drop the processed item and its already-processed siblings to keep memory flat
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    
+    return items
+
+
+def _remember_feed(url: str, etag: str, last_modified: str, rss: List[FeedItem]):
+    """store validators and parsed items for a feed, dropping the oldest entry when full"""
+    with _feed_validators_lock:
+        _feed_validators.pop(url, None)
+        _feed_validators[url] = (etag, last_modified, rss)
+        if len(_feed_validators) > _MAX_CACHED_FEEDS:
+            del _feed_validators[next(iter(_feed_validators))]
+
+
+def _download_rss_feed(url: str, timeout: int) -> List[FeedItem]:
+    """download and parse a feed, revalidating against the last download"""
+    # revalidate against the last download so unchanged feeds come back as an empty 304
+    headers = _FEED_HEADERS
+    cached = _feed_validators.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        headers = dict(_FEED_HEADERS)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    # stream the body so parsing overlaps with the download instead of waiting for all of it
+    response = session.get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        if response.status_code == 304 and cached:
+            return cached[2]
+        
+        response.raise_for_status()
+        
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > MAX_FEED_BYTES:
+            raise ValueError(f"feed is larger than {MAX_FEED_BYTES} bytes")
+        
+        # the decoded size is capped too, compressed bodies can expand far beyond content-length
+        response.raw.decode_content = True
+        try:
+            rss = parse_rss_items(_LimitedReader(response.raw, MAX_FEED_BYTES))
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e) from e
+        except Urllib3HTTPError as e:
+            # reading the raw stream bypasses requests, so map timeouts and broken
+            # connections to requests errors the way iter_content reports them
+            raise requests.ConnectionError(e) from e
+    finally:
+        response.close()
+    
+    etag = response.headers.get('ETag', '')
+    last_modified = response.headers.get('Last-Modified', '')
+    if etag or last_modified:
+        _remember_feed(url, etag, last_modified, rss)
+    
+    return rss
+
+
+def _record_feed_failure(url: str):
+    """count a failed download and put the feed on cool-down after repeated failures"""
+    with _feed_health_lock:
+        failures = _feed_failures.pop(url, 0) + 1
+        _feed_failures[url] = failures
+        if len(_feed_failures) > _MAX_CACHED_FEEDS:
+            del _feed_failures[next(iter(_feed_failures))]
+        
+        if failures >= _FEED_FAILURE_THRESHOLD:
+            _feed_cold_until.pop(url, None)
+            _feed_cold_until[url] = time.monotonic() + _FEED_COOLDOWN_SECONDS
+            if len(_feed_cold_until) > _MAX_CACHED_FEEDS:
+                del _feed_cold_until[next(iter(_feed_cold_until))]
+
+
+def _record_feed_success(url: str):
+    """forget the failures and any cool-down of a feed that downloaded fine"""
+    with _feed_health_lock:
+        _feed_failures.pop(url, None)
+        _feed_cold_until.pop(url, None)
+
+
+# feeds update every few minutes, so repeated calls within the window reuse the parsed feed
+@ttl_cache(120, stale_while_revalidate=60, maxsize=64)
+def fetch_rss_feed(url: str, timeout: int = 15) -> List[FeedItem]:
     """
     fetch and parse rss feed from url
+    concurrent calls for the same url share a single download
     
     args:
         url: rss feed url
         timeout: request timeout in seconds
         
     returns:
-        parsed rss feed object
+        list of parsed feed items
     """
-    # add headers to mimic a real browser (some sites require this)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-        'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Cache-Control': 'max-age=0'
-    }
-    
-    response = get(url, headers=headers, timeout=timeout)
-    response.raise_for_status()
-    return RSSParser.parse(response.text)
-
+    # fail fast on a feed that keeps failing instead of waiting for its timeout on every call
+    if time.monotonic() < _feed_cold_until.get(url, 0):
+        raise requests.ConnectionError(f"feed skipped after repeated failures, retrying in a minute: {url}")
+    
+    with _inflight_lock:
+        future = _inflight.get(url)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[url] = future
+    
+    # another caller is already downloading this feed, wait for its result
+    if not is_leader:
+        return future.result()
+    
+    try:
+        rss = _download_rss_feed(url, timeout)
+        _record_feed_success(url)
+        future.set_result(rss)
+        return rss
+    except Exception as e:
+        # network failures count towards the cool-down, bad feed content does not
+        if isinstance(e, (requests.RequestException, Urllib3HTTPError)):
+            _record_feed_failure(url)
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(url, None)
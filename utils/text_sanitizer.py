@@ -2,15 +2,72 @@
 text sanitization and beautification utilities for rss content
 """
 
+from __future__ import annotations
+
 import re
+import threading
 from html import unescape
-from typing import Optional, Dict, Any
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping, Optional, Dict, Any, List
 from datetime import datetime, date
-from dateutil import parser as date_parser
-import xml.etree.ElementTree as ET
-import json
+from utils.ttl_cache import ttl_cache
+
+# requests, bs4, dateutil and the json/xml parsers are imported by the functions that
+# use them, so callers that only clean titles and descriptions never load them
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+# etag, last-modified and extracted text from the last full download of recently scraped urls
+_MAX_CACHED_ARTICLES = 256
+_article_validators = {}
+_article_validators_lock = threading.Lock()
+
+# patterns compiled once, these run for every title and description
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_LEADING_DASH = re.compile(r'^\s*-\s*')
+_RE_ELLIPSIS = re.compile(r'\s*\.\.\.\s*$')
+_RE_PREFIX = re.compile(r'^(DAL NOSTRO INVIATO|ROMA|MILANO|di|Di)\s*-?\s*')
+
+# body of every <script type="application/ld+json"> block in a raw html page
+_RE_JSON_LD = re.compile(
+    rb'<script\b[^>]*(?<![\w-])type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.I | re.S
+)
+
+# page elements stripped before article extraction
+_UNWANTED_TAGS = frozenset([
+    "script", "style", "nav", "header", "footer", "aside", "menu",
+    "iframe", "noscript", "svg", "form", "button", "link", "meta"
+])
+
+# ad/navigation class names and id patterns, each folded into a single alternation
+_UNWANTED_CLASS_RE = re.compile('|'.join([
+    'ad', 'ads', 'advertisement', 'social-share', 'related-articles',
+    'comments', 'newsletter', 'subscription', 'paywall', 'menu',
+    'navbar', 'sidebar', 'widget', 'promo', 'banner', 'popup',
+    'overlay', 'modal', 'taboola', 'outbrain', 'recommend',
+    'share', 'toolbar', 'breadcrumb', 'tag', 'meta'
+]), re.I)
+_UNWANTED_ID_RE = re.compile('|'.join([
+    'menu', 'nav', 'sidebar', 'footer', 'header', 'comment', 'ad'
+]), re.I)
+
+# tag names, .classes and #ids in a simple css selector
+_RE_SELECTOR_TOKEN = re.compile(r'([.#]?)([\w-]+)')
+
+# text of an rss <guid>, with and without isPermaLink="true"
+_RE_GUID_PERMALINK = re.compile(
+    r'<guid\b[^>]*\bisPermaLink\s*=\s*["\']true["\'][^>]*>([^<]+)</guid>', re.I
+)
+_RE_GUID = re.compile(r'<guid\b[^>]*>([^<]+)</guid>', re.I)
+
+# characters kept clear of the cut when only a prefix of a long title or description is cleaned
+_PREFIX_MARGIN = 32
+
+# words marking a body paragraph as navigation or metadata rather than article text
+_SKIP_WORDS = ('cookie', 'privacy', 'terms', 'login', 'subscribe', 'menu')
 
 
 def clean_html_tags(text) -> str:
@@ -29,8 +86,12 @@ def clean_html_tags(text) -> str:
     # convert to string if it's a Tag object
     text_str = str(text)
     
+    # most titles carry no markup or entities, nothing to parse
+    if '<' not in text_str and '&' not in text_str:
+        return text_str.strip()
+    
     # remove html tags
-    clean_text = re.sub(r'<[^>]+>', '', text_str)
+    clean_text = _RE_HTML_TAG.sub('', text_str)
     
     # decode html entities
     clean_text = unescape(clean_text)
@@ -38,12 +99,49 @@ def clean_html_tags(text) -> str:
     return clean_text.strip()
 
 
-def beautify_description(description) -> str:
+def _has_irregular_whitespace(text: str) -> bool:
+    """check for runs of spaces or any whitespace other than a plain space"""
+    # every unicode whitespace character except ' ' is non-printable
+    return '  ' in text or not text.isprintable()
+
+
+def _clean_prefix(text: str, max_length: int, clean: Callable[[str], str]) -> str:
+    """
+    clean just enough of a long string to get the first max_length characters of the result
+    the cut is moved back to a tag start or whitespace so no tag or entity is split, and a
+    larger prefix is tried when the cleaned one comes out too short (markup-heavy input)
+    """
+    window = max_length * 2 + _PREFIX_MARGIN
+    while window < len(text):
+        head = text[:window]
+        # a '<' left open in the window may close far past it, so cut before the first one,
+        # otherwise at whitespace but never before the last '>', which may end a long tag
+        tag_end = head.rfind('>')
+        tag_start = head.find('<', tag_end + 1)
+        if tag_start != -1:
+            cut = tag_start
+        else:
+            cut = max(head.rfind(' '), head.rfind('\n'), tag_end + 1)
+        
+        if cut > max_length:
+            cleaned = clean(text[:cut])
+            # cleanup only changes the last few characters of a prefix, stay clear of them
+            if len(cleaned) > max_length + _PREFIX_MARGIN:
+                return cleaned
+        
+        window *= 4
+    
+    return clean(text)
+
+
+def beautify_description(description, max_length: Optional[int] = None) -> str:
     """
     beautify rss description text
     
     args:
         description: raw description text (can be string or Tag object)
+        max_length: only the first max_length characters of the result are needed,
+            long input is then cleaned from a prefix (default: none, clean everything)
         
     returns:
         beautified and cleaned description
@@ -51,15 +149,26 @@ def beautify_description(description) -> str:
     if not description:
         return ""
     
+    # cache on the string form, Tag objects are not reliably hashable
+    description = str(description)
+    if max_length:
+        return _clean_prefix(description, max_length, _beautify_description)
+    return _beautify_description(description)
+
+
+@lru_cache(maxsize=4096)
+def _beautify_description(description: str) -> str:
+    """beautify a description string, cached since feeds repeat items across polls"""
     # clean html tags
     clean_desc = clean_html_tags(description)
     
-    # remove extra whitespace and newlines
-    clean_desc = re.sub(r'\s+', ' ', clean_desc)
+    # remove extra whitespace and newlines, skipped when there is none
+    if _has_irregular_whitespace(clean_desc):
+        clean_desc = ' '.join(clean_desc.split())
     
     # remove common rss artifacts
-    clean_desc = re.sub(r'^\s*-\s*', '', clean_desc)  # remove leading dashes
-    clean_desc = re.sub(r'\s*\.\.\.\s*$', '...', clean_desc)  # normalize ellipsis
+    clean_desc = _RE_LEADING_DASH.sub('', clean_desc)  # remove leading dashes
+    clean_desc = _RE_ELLIPSIS.sub('...', clean_desc)  # normalize ellipsis
     
     # ensure proper sentence ending
     if clean_desc and not clean_desc.endswith(('.', '!', '?', '...')):
@@ -68,12 +177,14 @@ def beautify_description(description) -> str:
     return clean_desc.strip()
 
 
-def sanitize_title(title) -> str:
+def sanitize_title(title, max_length: Optional[int] = None) -> str:
     """
     sanitize and clean article title
     
     args:
         title: raw title text (can be string or Tag object)
+        max_length: only the first max_length characters of the result are needed,
+            long input is then cleaned from a prefix (default: none, clean everything)
         
     returns:
         clean title
@@ -81,14 +192,24 @@ def sanitize_title(title) -> str:
     if not title:
         return ""
     
+    title = str(title)
+    if max_length:
+        return _clean_prefix(title, max_length, _sanitize_title)
+    return _sanitize_title(title)
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_title(title: str) -> str:
+    """sanitize a title string (cached like _beautify_description)"""
     # clean html tags
     clean_title = clean_html_tags(title)
     
     # remove extra whitespace
-    clean_title = re.sub(r'\s+', ' ', clean_title)
+    if _has_irregular_whitespace(clean_title):
+        clean_title = ' '.join(clean_title.split())
     
     # remove common artifacts
-    clean_title = re.sub(r'^\s*-\s*', '', clean_title)
+    clean_title = _RE_LEADING_DASH.sub('', clean_title)
     
     return clean_title.strip()
 
@@ -163,79 +284,95 @@ def format_article_summary(title, description, link: str = "", pub_date: str = "
     return '\n'.join(summary_parts)
 
 
-def _get_browser_headers() -> dict:
-    """get http headers that mimic a real browser"""
-    return {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Cache-Control': 'max-age=0'
-    }
+@lru_cache(maxsize=None)
+def _json_loads() -> Callable:
+    """json parser for json-ld blocks, imported on first use"""
+    try:
+        # orjson parses the large json-ld blocks of news sites several times faster
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads
 
 
-def _extract_from_json_ld(soup: BeautifulSoup) -> str:
+def _extract_from_json_ld(content: bytes) -> str:
     """
     extract article content from json-ld structured data
     this is the most reliable method for corriere della sera
     """
-    json_ld_scripts = soup.find_all('script', {'type': 'application/ld+json'})
-    
-    for json_ld in json_ld_scripts:
+    # scanned on the raw page, so articles with structured data never need a parse tree
+    for match in _RE_JSON_LD.finditer(content):
+        script = match.group(1)
         try:
-            if json_ld.string:
-                data = json.loads(json_ld.string)
-                if isinstance(data, dict) and 'articleBody' in data:
-                    content = data['articleBody']
-                    if content and len(content) > 200:
-                        return content
-        except (json.JSONDecodeError, Exception):
+            script = script.decode('utf-8')
+        except UnicodeDecodeError:
+            # pages without utf-8 are almost always windows-1252 / latin-1
+            script = script.decode('cp1252', 'replace')
+        
+        try:
+            data = _json_loads()(script)
+            if isinstance(data, dict) and 'articleBody' in data:
+                body = data['articleBody']
+                if body and len(body) > 200:
+                    return body
+        except Exception:
             continue
     
     return ""
 
 
+def _is_unwanted_element(tag) -> bool:
+    """check whether an element is a layout tag or carries an ad/navigation class or id"""
+    if tag.name in _UNWANTED_TAGS:
+        return True
+    
+    classes = tag.get('class')
+    if classes and _UNWANTED_CLASS_RE.search(' '.join(classes)):
+        return True
+    
+    element_id = tag.get('id')
+    return bool(element_id and _UNWANTED_ID_RE.search(element_id))
+
+
 def _clean_soup_for_extraction(soup: BeautifulSoup):
     """remove unwanted html elements that interfere with content extraction"""
-    # remove script, style, and navigation elements
-    unwanted_tags = [
-        "script", "style", "nav", "header", "footer", "aside", "menu",
-        "iframe", "noscript", "svg", "form", "button", "link", "meta"
-    ]
-    for element in soup(unwanted_tags):
-        element.decompose()
-    
-    # remove elements with ad/navigation class names
-    unwanted_classes = [
-        'ad', 'ads', 'advertisement', 'social-share', 'related-articles',
-        'comments', 'newsletter', 'subscription', 'paywall', 'menu',
-        'navbar', 'sidebar', 'widget', 'promo', 'banner', 'popup',
-        'overlay', 'modal', 'taboola', 'outbrain', 'recommend',
-        'share', 'toolbar', 'breadcrumb', 'tag', 'meta'
-    ]
-    for class_name in unwanted_classes:
-        for elem in soup.find_all(class_=re.compile(class_name, re.I)):
-            elem.decompose()
-    
-    # remove elements with navigation/ad id patterns
-    unwanted_ids = ['menu', 'nav', 'sidebar', 'footer', 'header', 'comment', 'ad']
-    for id_pattern in unwanted_ids:
-        for elem in soup.find_all(id=re.compile(id_pattern, re.I)):
-            elem.decompose()
+    # tags, classes and ids are all checked in a single tree walk. matches come back in
+    # document order, descendants of an element removed earlier were destroyed with it
+    for element in soup.find_all(_is_unwanted_element):
+        if not element.decomposed:
+            element.decompose()
+
+
+def _page_features(soup: BeautifulSoup) -> set:
+    """collect every tag name, .class and #id on the page in a single walk"""
+    features = set()
+    for tag in soup.find_all(True):
+        features.add(tag.name)
+        for class_name in tag.get('class') or ():
+            features.add('.' + class_name.lower())
+        element_id = tag.get('id')
+        if element_id:
+            features.add('#' + element_id.lower())
+    return features
+
+
+@lru_cache(maxsize=128)
+def _selector_requirements(selector: str) -> frozenset:
+    """tag names, .classes and #ids that must all be on the page for a css selector to match"""
+    # attribute tests and pseudo-classes are not modelled, such selectors are always tried
+    if '[' in selector or ':' in selector:
+        return frozenset()
+    return frozenset(prefix + name.lower() for prefix, name in _RE_SELECTOR_TOKEN.findall(selector))
 
 
 def _extract_paragraphs(elements, min_length: int = 50) -> list:
     """extract text from paragraph elements, filtering out short ones"""
-    return [
-        elem.get_text(strip=True) 
-        for elem in elements 
-        if len(elem.get_text(strip=True)) > min_length
-    ]
+    # get_text walks the whole subtree, so it runs once per element
+    texts = (elem.get_text(strip=True) for elem in elements)
+    return [text for text in texts if len(text) > min_length]
 
 
-def _try_corriere_selectors(soup: BeautifulSoup) -> str:
+def _try_corriere_selectors(soup: BeautifulSoup, features: set) -> str:
     """try corriere della sera specific css selectors"""
     selectors = [
         'article .chapter-paragraph p',
@@ -247,6 +384,8 @@ def _try_corriere_selectors(soup: BeautifulSoup) -> str:
     ]
     
     for selector in selectors:
+        if not _selector_requirements(selector) <= features:
+            continue
         elements = soup.select(selector)
         if elements:
             paragraphs = _extract_paragraphs(elements)
@@ -256,7 +395,7 @@ def _try_corriere_selectors(soup: BeautifulSoup) -> str:
     return ""
 
 
-def _try_gazzetta_selectors(soup: BeautifulSoup) -> str:
+def _try_gazzetta_selectors(soup: BeautifulSoup, features: set) -> str:
     """try gazzetta dello sport specific css selectors"""
     selectors = [
         'div.content p',                    # main content div
@@ -273,6 +412,8 @@ def _try_gazzetta_selectors(soup: BeautifulSoup) -> str:
     ]
     
     for selector in selectors:
+        if not _selector_requirements(selector) <= features:
+            continue
         elements = soup.select(selector)
         if elements:
             paragraphs = _extract_paragraphs(elements)
@@ -299,7 +440,7 @@ def _try_article_tag(soup: BeautifulSoup) -> str:
     return ""
 
 
-def _try_common_selectors(soup: BeautifulSoup) -> str:
+def _try_common_selectors(soup: BeautifulSoup, features: set) -> str:
     """try common news site css selectors"""
     selectors = [
         '[itemprop="articleBody"]',
@@ -318,6 +459,8 @@ def _try_common_selectors(soup: BeautifulSoup) -> str:
     ]
     
     for selector in selectors:
+        if not _selector_requirements(selector) <= features:
+            continue
         content_elem = soup.select_one(selector)
         if content_elem:
             paragraphs = _extract_paragraphs(content_elem.find_all('p'))
@@ -340,17 +483,15 @@ def _try_main_tag(soup: BeautifulSoup) -> str:
     return ""
 
 
-def _is_valid_paragraph(p_tag) -> bool:
-    """check if a paragraph is likely article content (not navigation/ads)"""
-    text = p_tag.get_text(strip=True)
-    
+def _is_valid_paragraph(p_tag, text: str) -> bool:
+    """check if a paragraph, given its already extracted text, is likely article content (not navigation/ads)"""
     # must be substantial
     if len(text) < 50:
         return False
     
     # skip navigation/metadata keywords
-    skip_words = ['cookie', 'privacy', 'terms', 'login', 'subscribe', 'menu']
-    if any(word in text.lower() for word in skip_words):
+    lowered = text.lower()
+    if any(word in lowered for word in _SKIP_WORDS):
         return False
     
     # skip paragraphs with too many links (likely navigation)
@@ -366,11 +507,11 @@ def _try_body_paragraphs(soup: BeautifulSoup) -> str:
     if not body:
         return ""
     
-    candidate_paragraphs = [
-        p.get_text(strip=True) 
-        for p in body.find_all('p') 
-        if _is_valid_paragraph(p)
-    ]
+    candidate_paragraphs = []
+    for p in body.find_all('p'):
+        text = p.get_text(strip=True)
+        if _is_valid_paragraph(p, text):
+            candidate_paragraphs.append(text)
     
     if len(candidate_paragraphs) >= 3:
         return ' '.join(candidate_paragraphs)
@@ -384,10 +525,10 @@ def _clean_extracted_text(text: str) -> str:
         return text
     
     # normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = ' '.join(text.split())
     
     # remove common italian article prefixes
-    text = re.sub(r'^(DAL NOSTRO INVIATO|ROMA|MILANO|di|Di)\s*-?\s*', '', text)
+    text = _RE_PREFIX.sub('', text)
     
     # remove duplicated content (some sites repeat the article text)
     text = _remove_duplicate_content(text)
@@ -405,24 +546,134 @@ def _remove_duplicate_content(text: str) -> str:
     
     # split text in half and check if they're similar
     mid_point = len(text) // 2
-    first_half = text[:mid_point]
-    second_half = text[mid_point:]
     
     # check if first 200 chars of each half are very similar
-    # (allowing for small differences due to formatting)
-    first_sample = first_half[:200].lower()
-    second_sample = second_half[:200].lower()
+    # (allowing for small differences due to formatting). the samples are sliced
+    # straight from the text, the halves are only copied once a duplicate is found
+    first_sample = text[:min(mid_point, 200)].lower()
+    second_sample = text[mid_point:mid_point + 200].lower()
     
     # calculate similarity (simple approach: check if 80% of words match)
     first_words = set(first_sample.split())
+    if not first_words:
+        return text
+    
     second_words = set(second_sample.split())
+    similarity = len(first_words & second_words) / len(first_words)
     
-    if len(first_words) > 0:
-        similarity = len(first_words & second_words) / len(first_words)
-        
-        # if very similar, it's likely duplicated - return first half
-        if similarity > 0.8:
-            return first_half.strip()
+    # if very similar, it's likely duplicated - return first half
+    if similarity > 0.8:
+        return text[:mid_point].strip()
+    
+    return text
+
+
+def _extract_article_text(content: bytes) -> str:
+    """run the extraction strategies over a downloaded article page"""
+    # strategy 1: json-ld structured data (best for corriere della sera)
+    text = _extract_from_json_ld(content)
+    if text:
+        return _clean_extracted_text(text)
+    
+    from bs4 import BeautifulSoup
+    
+    # lxml's c parser is much faster than the pure-python html.parser on full pages
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # prepare soup for paragraph extraction
+    _clean_soup_for_extraction(soup)
+    
+    # each css selector walks the whole page, so the ones that cannot match are skipped
+    features = _page_features(soup)
+    
+    # strategy 2: site-specific selectors (corriere, gazzetta)
+    content = _try_corriere_selectors(soup, features)
+    if content:
+        return _clean_extracted_text(content)
+    
+    content = _try_gazzetta_selectors(soup, features)
+    if content:
+        return _clean_extracted_text(content)
+    
+    # strategy 3: article tag
+    content = _try_article_tag(soup)
+    if content:
+        return _clean_extracted_text(content)
+    
+    # strategy 4: common news site selectors
+    content = _try_common_selectors(soup, features)
+    if content:
+        return _clean_extracted_text(content)
+    
+    # strategy 5: main tag
+    content = _try_main_tag(soup)
+    if content:
+        return _clean_extracted_text(content)
+    
+    # strategy 6: fallback to body paragraphs
+    content = _try_body_paragraphs(soup)
+    if content:
+        return _clean_extracted_text(content)
+    
+    # no content found
+    return "limited content extracted (0 chars) - article may be behind paywall or use dynamic loading"
+
+
+def _remember_article(url: str, etag: str, last_modified: str, text: str):
+    """store validators and extracted text for a url, dropping the oldest entry when full"""
+    with _article_validators_lock:
+        _article_validators.pop(url, None)
+        _article_validators[url] = (etag, last_modified, text)
+        if len(_article_validators) > _MAX_CACHED_ARTICLES:
+            del _article_validators[next(iter(_article_validators))]
+
+
+@lru_cache(maxsize=None)
+def _browser_headers() -> Mapping[str, str]:
+    """http headers that mimic a real browser, built on the first scrape and shared read-only"""
+    from utils.http_session import ACCEPT_ENCODING
+    
+    return MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Cache-Control': 'max-age=0'
+    })
+
+
+@ttl_cache(900, maxsize=512)
+def _download_article(url: str, timeout: int) -> str:
+    """
+    download an article and extract its text, raising on request errors
+    results are cached for 15 minutes, failures are not cached
+    """
+    from utils.http_session import session
+    
+    # revalidate against the last scrape so unchanged articles come back as an empty 304
+    headers = _browser_headers()
+    cached = _article_validators.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        headers = dict(headers)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    response = session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[2]
+    response.raise_for_status()
+    
+    text = _extract_article_text(response.content)
+    
+    etag = response.headers.get('ETag', '')
+    last_modified = response.headers.get('Last-Modified', '')
+    if etag or last_modified:
+        _remember_article(url, etag, last_modified, text)
     
     return text
 
@@ -440,55 +691,36 @@ def scrape_article_content(url: str, timeout: int = 10) -> str:
         cleaned article text content or error message
     """
     try:
-        response = requests.get(url, headers=_get_browser_headers(), timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # strategy 1: json-ld structured data (best for corriere della sera)
-        content = _extract_from_json_ld(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        # prepare soup for paragraph extraction
-        _clean_soup_for_extraction(soup)
-        
-        # strategy 2: site-specific selectors (corriere, gazzetta)
-        content = _try_corriere_selectors(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        content = _try_gazzetta_selectors(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        # strategy 3: article tag
-        content = _try_article_tag(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        # strategy 4: common news site selectors
-        content = _try_common_selectors(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        # strategy 5: main tag
-        content = _try_main_tag(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        # strategy 6: fallback to body paragraphs
-        content = _try_body_paragraphs(soup)
-        if content:
-            return _clean_extracted_text(content)
-        
-        # no content found
-        return "limited content extracted (0 chars) - article may be behind paywall or use dynamic loading"
-        
+        return _download_article(url, timeout)
     except Exception as e:
         return f"error scraping content: {str(e)}"
 
 
+def scrape_article_contents(urls: List[str], timeout: int = 10, max_workers: int = 8) -> List[str]:
+    """
+    scrape several article urls concurrently
+    
+    args:
+        urls: article urls to scrape (empty urls are skipped)
+        timeout: request timeout in seconds
+        max_workers: maximum number of concurrent scrapes
+        
+    returns:
+        scraped content for each url, in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def _scrape(url: str) -> str:
+        return scrape_article_content(url, timeout=timeout) if url else ""
+    
+    # scraping is network bound, so overlapping the requests hides most of their latency
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(_scrape, urls))
+
+
 def is_today_news(pub_date_str: str) -> bool:
     """
     check if a publication date is from today
@@ -499,19 +731,16 @@ def is_today_news(pub_date_str: str) -> bool:
     returns:
         true if the news is from today
     """
-    if not pub_date_str:
-        return True  # include items without date to be safe
+    # imported here so callers that only clean text never load the feed helpers
+    from utils.rss_helpers import MIN_DATE, parse_date_safely
     
-    try:
-        # parse the date string
-        pub_date = date_parser.parse(pub_date_str)
-        today = date.today()
-        
-        # check if it's today's date
-        return pub_date.date() == today
-        
-    except Exception:
-        return True  # include items with unparseable dates to be safe
+    pub_date = parse_date_safely(pub_date_str)
+    
+    # include items without a date or with an unparseable one to be safe
+    if pub_date == MIN_DATE:
+        return True
+    
+    return pub_date.date() == date.today()
 
 
 def extract_guid_link(item_xml: str) -> str:
@@ -524,6 +753,18 @@ def extract_guid_link(item_xml: str) -> str:
     returns:
         permalink url or empty string if not found
     """
+    # plain-text guids are read straight from the markup, permalinks first
+    for pattern in (_RE_GUID_PERMALINK, _RE_GUID):
+        match = pattern.search(item_xml)
+        if match:
+            return unescape(match.group(1)).strip()
+    
+    if '<guid' not in item_xml:
+        return ""
+    
+    # cdata and other unusual guids still go through a real xml parse
+    import xml.etree.ElementTree as ET
+    
     try:
         # parse the xml
         root = ET.fromstring(f"<root>{item_xml}</root>")
@@ -547,7 +788,8 @@ def extract_guid_link(item_xml: str) -> str:
 def create_news_summary(title: str, description: str, link: str, pub_date: str, 
                        title_limit: int = 100, desc_limit: int = 300, 
                        scrape_content: bool = True, content_limit: int = 3000,
-                       summarize_content: bool = False, summary_method: str = 'auto') -> Dict[str, Any]:
+                       summarize_content: bool = False, summary_method: str = 'auto',
+                       scraped_content: Optional[str] = None) -> Dict[str, Any]:
     """
     create a comprehensive news summary with optional content scraping and summarization
     
@@ -562,35 +804,37 @@ def create_news_summary(title: str, description: str, link: str, pub_date: str,
         content_limit: maximum scraped content length (default: 3000)
         summarize_content: whether to summarize scraped content (default: false)
         summary_method: summarization method - 'auto', 'extractive', 'keyword', or 'lead' (default: 'auto')
+        scraped_content: content already scraped by the caller, skips scraping the link (default: none)
         
     returns:
         dictionary with cleaned title, description, link, date and scraped content (optionally summarized)
     """
-    from utils.text_summarizer import auto_summarize
-    
-    # clean and truncate title
-    clean_title = sanitize_title(title)
+    # clean and truncate title, only cleaning as much as the limit keeps
+    clean_title = sanitize_title(title, max_length=title_limit)
     if len(clean_title) > title_limit:
         clean_title = clean_title[:title_limit-3] + "..."
     
     # clean and truncate description
-    clean_desc = beautify_description(description)
+    clean_desc = beautify_description(description, max_length=desc_limit)
     if len(clean_desc) > desc_limit:
         clean_desc = clean_desc[:desc_limit-3] + "..."
     
-    # scrape full content if requested
-    scraped_content = ""
-    if scrape_content and link:
+    # scrape full content if requested, unless the caller already scraped it
+    if not scrape_content or not link:
+        scraped_content = ""
+    elif scraped_content is None:
         scraped_content = scrape_article_content(link)
-        
-        # summarize if requested
-        if summarize_content and scraped_content:
-            if not scraped_content.startswith("error") and not scraped_content.startswith("limited"):
-                scraped_content = auto_summarize(scraped_content, max_length=content_limit, method=summary_method)
-        else:
-            # just limit to reasonable size
-            if len(scraped_content) > content_limit and not scraped_content.startswith("error") and not scraped_content.startswith("limited"):
-                scraped_content = scraped_content[:content_limit] + "..."
+    
+    # summarize if requested
+    if summarize_content and scraped_content:
+        if not scraped_content.startswith("error") and not scraped_content.startswith("limited"):
+            # imported here so calls without summarization never load the summarizer
+            from utils.text_summarizer import auto_summarize
+            scraped_content = auto_summarize(scraped_content, max_length=content_limit, method=summary_method)
+    else:
+        # just limit to reasonable size
+        if len(scraped_content) > content_limit and not scraped_content.startswith("error") and not scraped_content.startswith("limited"):
+            scraped_content = scraped_content[:content_limit] + "..."
     
     return {
         "title": clean_title,
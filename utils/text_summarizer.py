@@ -6,13 +6,58 @@ uses extractive summarization techniques
 import re
 from typing import List, Tuple
 from collections import Counter
+from itertools import repeat
+
+# patterns compiled once at import, these run for every sentence of every article
+_RE_WORD = re.compile(r'\b\w+\b')
+# a run of sentence punctuation followed by whitespace, in one pass. a run starting with
+# '.' does not count right after Dr, Mr, Mrs, Ms, Prof, Sr or Jr (one fixed-width
+# lookbehind per abbreviation, since re needs fixed-width lookbehinds)
+_RE_SENTENCE_SPLIT = re.compile(
+    r'(?:[!?]|(?<!\bDr)(?<!\bMr)(?<!\bMrs)(?<!\bMs)(?<!\bProf)(?<!\bSr)(?<!\bJr)\.)[.!?]*\s+'
+)
+_RE_CAP_WORDS = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_RE_NUMBERS = re.compile(r'\b\d+(?:[.,]\d+)?(?:\s*%|€|\$|km|km/h|mila|milioni|miliardi)?\b')
+
+# every ascii character that is not a word character (\w), mapped to a space
+_ASCII_NON_WORD = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')
+})
+
+# italian and english stop words (common ones), ignored when ranking sentences
+_STOP_WORDS = frozenset({
+    # italian
+    'il', 'lo', 'la', 'i', 'gli', 'le', 'un', 'uno', 'una', 'di', 'a', 'da', 'in', 
+    'con', 'su', 'per', 'tra', 'fra', 'del', 'dello', 'della', 'dei', 'degli', 'delle',
+    'al', 'allo', 'alla', 'ai', 'agli', 'alle', 'dal', 'dallo', 'dalla', 'dai', 'dagli',
+    'dalle', 'nel', 'nello', 'nella', 'nei', 'negli', 'nelle', 'sul', 'sullo', 'sulla',
+    'sui', 'sugli', 'sulle', 'che', 'è', 'sono', 'hai', 'ha', 'hanno', 'come', 'più',
+    'anche', 'se', 'non', 'ma', 'quando', 'dove', 'chi', 'cosa', 'quale', 'questo',
+    'questa', 'questi', 'queste', 'quello', 'quella', 'quelli', 'quelle', 'ogni',
+    'altro', 'altra', 'altri', 'altre', 'molto', 'poco', 'tanto', 'troppo',
+    # english
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might',
+    'can', 'this', 'that', 'these', 'those', 'as', 'if', 'when', 'where', 'who',
+    'which', 'what', 'how', 'why', 'all', 'each', 'every', 'some', 'any', 'no',
+    'not', 'very', 'more', 'most', 'much', 'many', 'few', 'less', 'least'
+})
 
 
 def _clean_sentence(sentence: str) -> str:
     """clean and normalize a sentence"""
     # remove extra whitespace
-    sentence = re.sub(r'\s+', ' ', sentence)
-    return sentence.strip()
+    return ' '.join(sentence.split())
+
+
+def _tokenize(text: str) -> List[str]:
+    """lowercase words of a text, same result as _RE_WORD.findall(text.lower())"""
+    text = text.lower()
+    # ascii text (most english sentences) is split in c without entering the regex engine
+    if text.isascii():
+        return text.translate(_ASCII_NON_WORD).split()
+    return _RE_WORD.findall(text)
 
 
 def _split_into_sentences(text: str) -> List[str]:
@@ -20,16 +65,11 @@ def _split_into_sentences(text: str) -> List[str]:
     split text into sentences
     handles common abbreviations and edge cases
     """
-    # replace common abbreviations to avoid false splits
-    text = re.sub(r'\b(Dr|Mr|Mrs|Ms|Prof|Sr|Jr)\.', r'\1<DOT>', text)
-    
-    # split on sentence endings
-    sentences = re.split(r'[.!?]+\s+', text)
+    # split on sentence endings, except a dot right after a common abbreviation
+    sentences = _RE_SENTENCE_SPLIT.split(text)
     
-    # restore dots and clean
-    sentences = [_clean_sentence(s.replace('<DOT>', '.')) for s in sentences if s.strip()]
-    
-    return sentences
+    # clean and drop empty pieces
+    return [s for s in map(_clean_sentence, sentences) if s]
 
 
 def _calculate_word_frequencies(sentences: List[str]) -> dict:
@@ -37,34 +77,9 @@ def _calculate_word_frequencies(sentences: List[str]) -> dict:
     calculate word frequency scores for ranking
     filters out common stop words
     """
-    # italian and english stop words (common ones)
-    stop_words = {
-        # italian
-        'il', 'lo', 'la', 'i', 'gli', 'le', 'un', 'uno', 'una', 'di', 'a', 'da', 'in', 
-        'con', 'su', 'per', 'tra', 'fra', 'del', 'dello', 'della', 'dei', 'degli', 'delle',
-        'al', 'allo', 'alla', 'ai', 'agli', 'alle', 'dal', 'dallo', 'dalla', 'dai', 'dagli',
-        'dalle', 'nel', 'nello', 'nella', 'nei', 'negli', 'nelle', 'sul', 'sullo', 'sulla',
-        'sui', 'sugli', 'sulle', 'che', 'è', 'sono', 'hai', 'ha', 'hanno', 'come', 'più',
-        'anche', 'se', 'non', 'ma', 'quando', 'dove', 'chi', 'cosa', 'quale', 'questo',
-        'questa', 'questi', 'queste', 'quello', 'quella', 'quelli', 'quelle', 'ogni',
-        'altro', 'altra', 'altri', 'altre', 'molto', 'poco', 'tanto', 'troppo',
-        # english
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-        'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-        'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might',
-        'can', 'this', 'that', 'these', 'those', 'as', 'if', 'when', 'where', 'who',
-        'which', 'what', 'how', 'why', 'all', 'each', 'every', 'some', 'any', 'no',
-        'not', 'very', 'more', 'most', 'much', 'many', 'few', 'less', 'least'
-    }
-    
-    # collect all words
-    all_words = []
-    for sentence in sentences:
-        words = re.findall(r'\b\w+\b', sentence.lower())
-        all_words.extend([w for w in words if w not in stop_words and len(w) > 2])
-    
-    # calculate frequencies
-    word_freq = Counter(all_words)
+    # tokenize every sentence in one pass and count the meaningful words
+    words = _tokenize(' '.join(sentences))
+    word_freq = Counter(w for w in words if len(w) > 2 and w not in _STOP_WORDS)
     
     # normalize frequencies (0-1 scale)
     if word_freq:
@@ -86,9 +101,9 @@ def _score_sentences(sentences: List[str], word_freq: dict) -> List[Tuple[int, f
         if len(sentence.split()) < 5:
             continue
         
-        # calculate word frequency score
-        words = re.findall(r'\b\w+\b', sentence.lower())
-        sentence_score = sum(word_freq.get(word, 0) for word in words)
+        # calculate word frequency score, the dict lookups run in c via map
+        words = _tokenize(sentence)
+        sentence_score = sum(map(word_freq.get, words, repeat(0)))
         
         # normalize by sentence length to avoid bias towards long sentences
         if len(words) > 0:
@@ -184,19 +199,21 @@ def keyword_based_summary(text: str, max_length: int = 500) -> str:
     keywords = set()
     
     # capitalized words (likely names, places, organizations)
-    keywords.update(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text))
+    keywords.update(_RE_CAP_WORDS.findall(text))
     
     # numbers with context
-    keywords.update(re.findall(r'\b\d+(?:[.,]\d+)?(?:\s*%|€|\$|km|km/h|mila|milioni|miliardi)?\b', text))
+    keywords.update(_RE_NUMBERS.findall(text))
     
     # score sentences by keyword density
     scored = []
     for idx, sentence in enumerate(sentences):
-        if len(sentence.split()) < 5:
+        word_count = len(sentence.split())
+        if word_count < 5:
             continue
         
-        keyword_count = sum(1 for kw in keywords if kw in sentence)
-        score = keyword_count / len(sentence.split()) if sentence else 0
+        # substring checks run in c via map, overlapping keywords each count once
+        keyword_count = sum(map(sentence.__contains__, keywords))
+        score = keyword_count / word_count
         
         # boost first sentences
         if idx < 2:
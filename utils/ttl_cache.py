@@ -0,0 +1,94 @@
+"""
+in-process time-based cache for upstream fetches
+"""
+
+import inspect
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def _make_key(signature: inspect.Signature, args: tuple, kwargs: dict) -> Tuple:
+    """build a hashable cache key from call arguments, the same for positional, keyword and default values"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.args + tuple(sorted(bound.kwargs.items()))
+
+
+def ttl_cache(ttl_seconds: float, stale_while_revalidate: float = 0, maxsize: Optional[int] = None) -> Callable:
+    """
+    cache function results for a fixed time window
+
+    args:
+        ttl_seconds: how long a cached result stays fresh
+        stale_while_revalidate: seconds past expiry during which the stale result is returned
+            immediately while a background thread refreshes it (default: 0, disabled)
+        maxsize: most entries kept, the least recently stored is dropped first (default: unbounded)
+
+    returns:
+        decorator that adds caching to the wrapped function
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        refreshing = set()
+        lock = threading.Lock()
+
+        def _store(key: Tuple, value: Any):
+            """insert or renew an entry, caller must hold the lock"""
+            cache.pop(key, None)
+            cache[key] = (time.monotonic() + ttl_seconds, value)
+            if maxsize is not None and len(cache) > maxsize:
+                del cache[next(iter(cache))]
+
+        def _refresh(key: Tuple, args: tuple, kwargs: dict):
+            """recompute a stale entry, keeping the old value if the call fails"""
+            try:
+                value = func(*args, **kwargs)
+                with lock:
+                    _store(key, value)
+            except Exception:
+                pass
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(signature, args, kwargs)
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    expires_at, value = entry
+                    if now < expires_at:
+                        return value
+
+                    if now < expires_at + stale_while_revalidate:
+                        # serve the stale value while a single background refresh runs
+                        if key not in refreshing:
+                            refreshing.add(key)
+                            threading.Thread(
+                                target=_refresh, args=(key, args, kwargs), daemon=True
+                            ).start()
+                        return value
+
+                    # evict expired entry on access
+                    del cache[key]
+
+            value = func(*args, **kwargs)
+            with lock:
+                _store(key, value)
+            return value
+
+        def cache_clear():
+            """drop every cached entry"""
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator